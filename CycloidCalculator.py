@@ -1,73 +1,229 @@
 import csv
+import math
 import os
 import tkinter as tk
 from tkinter import ttk
 
+def _id_key(inner_diameter):
+    """
+    Quantizes an inner diameter to an integer key (1e-6 mm resolution)
+    so bearings can be indexed in a dict instead of scanned linearly.
+    """
+    return int(round(inner_diameter * 1e6))
+
+def build_columns(bearings_data):
+    """
+    Packs the bearing catalog into struct-of-arrays form: one contiguous
+    float64 array per numeric column plus an object array of part numbers.
+    This is the layout used for vectorized tolerance-range queries.
+    Requires NumPy, which is optional and only imported here.
+    """
+    import numpy as np
+    return {
+        'PartNumber': np.array([b['PartNumber'] for b in bearings_data], dtype=object),
+        'ID': np.fromiter((b['ID'] for b in bearings_data), dtype=np.float64),
+        'OD': np.fromiter((b['OD'] for b in bearings_data), dtype=np.float64),
+        'Thickness': np.fromiter((b['Thickness'] for b in bearings_data), dtype=np.float64),
+    }
+
 def load_bearings(csv_filename):
     """
     Loads bearing data from the specified CSV file.
-    Returns a list of dictionaries, each representing one bearing entry.
+    Returns a tuple (bearings_data, bearings_index) where bearings_data is
+    a list of dictionaries and bearings_index maps quantized ID -> bearing.
     """
     bearings_data = []
     if not os.path.isfile(csv_filename):
-        return bearings_data
+        return bearings_data, {}
 
     with open(csv_filename, mode='r', newline='', encoding='utf-8') as csv_file:
-        reader = csv.DictReader(csv_file)
+        # csv.reader tokenizes rows in C; resolve column positions once from
+        # the header instead of building a dict per row like DictReader does
+        reader = csv.reader(csv_file)
+        headers = next(reader, None)
+        if headers is None:
+            return bearings_data, {}
+        pn_i = headers.index('Bearing')
+        id_i = headers.index('Inner Diameter (ID)')
+        od_i = headers.index('Outer Diameter (OD)')
+        th_i = headers.index('Thickness')
         for row in reader:
-            # Convert ID, OD, and Thickness to floats or ints as appropriate
+            # csv.reader yields [] for blank lines; skip them like
+            # DictReader used to
+            if not row:
+                continue
+            # Convert ID, OD, and Thickness to floats as appropriate
             # PartNumber stays as a string
             bearings_data.append({
-                'PartNumber': row['PartNumber'],
-                'ID': float(row['ID']),
-                'OD': float(row['OD']),
-                'Thickness': float(row['Thickness'])
+                'PartNumber': row[pn_i],
+                'ID': float(row[id_i]),
+                'OD': float(row[od_i]),
+                'Thickness': float(row[th_i])
             })
-    return bearings_data
+    bearings_index = {_id_key(b['ID']): b for b in bearings_data}
+    return bearings_data, bearings_index
 
-def find_bearing_by_ID(bearings_data, inner_diameter):
+def find_bearing_by_ID(bearings_index, inner_diameter):
     """
-    Searches the list of bearings for an entry with matching inner diameter.
+    Looks up a bearing by inner diameter in the quantized-ID index.
     Returns the bearing dictionary if found, else None.
     """
-    for bearing in bearings_data:
-        if abs(bearing['ID'] - inner_diameter) < 1e-6:
-            return bearing
-    return None
+    return bearings_index.get(_id_key(inner_diameter))
+
+# Column arrays for find_bearings_by_ID_range, built lazily on first use
+_bearings_columns = None
+
+def find_bearings_by_ID_range(inner_diameter, tolerance=1e-6):
+    """
+    Vectorized tolerance query over the column arrays: returns a list of
+    bearing dictionaries whose ID is within tolerance of inner_diameter.
+    One C-level subtract/abs/compare over contiguous float64 buffers,
+    suited to loose tolerances or bulk validation; exact single-ID
+    lookups should keep using find_bearing_by_ID. NumPy is imported and
+    the columns are built on the first call, so startup never pays for
+    either.
+    """
+    import numpy as np
+    global _bearings_columns
+    if _bearings_columns is None:
+        _bearings_columns = build_columns(bearings_list)
+    columns = _bearings_columns
+    hits = np.flatnonzero(np.abs(columns['ID'] - inner_diameter) < tolerance)
+    return [{key: columns[key][i] for key in columns} for i in hits]
+
+# Delay (ms) before a trace callback runs after the last keystroke
+_DEBOUNCE_MS = 80
+# Maps callback name -> pending `after` id so rapid edits coalesce
+_pending = {}
+
+def _debounce(name, callback):
+    """
+    Schedules callback to run _DEBOUNCE_MS after the most recent edit,
+    cancelling any run already scheduled under the same name. Typing a
+    whole number then fires one lookup instead of one per character.
+    """
+    pending = _pending.pop(name, None)
+    if pending is not None:
+        root.after_cancel(pending)
+    _pending[name] = root.after(_DEBOUNCE_MS, callback)
 
 def on_shaft_diameter_change(*args):
     """
     Event handler for when the shaft diameter changes.
-    Looks up bearing data and auto-populates fields if found.
+    Debounces the keystroke, then runs the bearing lookup.
     """
-    try:
-        sd = float(entry_shaft_diameter.get())
-    except ValueError:
-        return
+    _debounce('shaft', _do_shaft_change)
 
-    found_bearing = find_bearing_by_ID(bearings_list, sd)
-    if found_bearing:
-        bearing_thickness_var.set(str(found_bearing['Thickness']))
-        bearing_od_var.set(str(found_bearing['OD']))
-        part_number_shaft_var.set(found_bearing['PartNumber'])
-        # The cycloidal disc ID is set to the bearing OD
-        cycloidal_disc_id_var.set(str(found_bearing['OD']))
+def _make_shaft_handler():
+    """
+    Builds the shaft-diameter worker with the Tk getter, setters and
+    lookup pre-bound as default arguments, so every name the handler
+    touches per keystroke resolves via LOAD_FAST instead of a global
+    plus attribute lookup. Called once the widgets exist.
+    """
+    def handler(getter=entry_shaft_diameter.get,
+                find=find_bearing_by_ID,
+                index=bearings_index,
+                thickness_set=bearing_thickness_var.set,
+                od_set=bearing_od_var.set,
+                part_number_set=part_number_shaft_var.set,
+                disc_id_set=cycloidal_disc_id_var.set):
+        """
+        Looks up bearing data for the shaft diameter and auto-populates
+        fields if found.
+        """
+        _pending.pop('shaft', None)
+        # Skip the lookup when the entry text has not actually changed,
+        # e.g. a programmatic .set() re-firing the trace with the same value
+        s = getter()
+        if s == handler._last:
+            return
+        try:
+            sd = float(s)
+        except ValueError:
+            return
+        handler._last = s
+
+        found_bearing = find(index, sd)
+        if found_bearing:
+            thickness_set(str(found_bearing['Thickness']))
+            od_set(str(found_bearing['OD']))
+            part_number_set(found_bearing['PartNumber'])
+            # The cycloidal disc ID is set to the bearing OD
+            disc_id_set(str(found_bearing['OD']))
+    handler._last = None
+    return handler
 
 def on_roller_base_diameter_change(*args):
     """
     Event handler for the roller base diameter.
-    Looks up bearing data and auto-populates fields if found.
+    Debounces the keystroke, then runs the bearing lookup.
+    """
+    _debounce('roller_base', _do_roller_base_change)
+
+def _make_roller_base_handler():
+    """
+    Same factory pattern as _make_shaft_handler, for the roller base
+    diameter fields.
+    """
+    def handler(getter=entry_roller_base_diameter.get,
+                find=find_bearing_by_ID,
+                index=bearings_index,
+                thickness_set=roller_base_bearing_thickness_var.set,
+                od_set=roller_base_bearing_od_var.set,
+                part_number_set=part_number_roller_base_var.set):
+        """
+        Looks up bearing data for the roller base diameter and
+        auto-populates fields if found.
+        """
+        _pending.pop('roller_base', None)
+        # Same memoization as the shaft handler: bail out on repeat values
+        s = getter()
+        if s == handler._last:
+            return
+        try:
+            rbd = float(s)
+        except ValueError:
+            return
+        handler._last = s
+
+        found_bearing = find(index, rbd)
+        if found_bearing:
+            thickness_set(str(found_bearing['Thickness']))
+            od_set(str(found_bearing['OD']))
+            part_number_set(found_bearing['PartNumber'])
+    handler._last = None
+    return handler
+
+def _to_float(s):
     """
+    Converts an entry string to float, returning None on invalid input.
+    Rejects empty or obviously non-numeric strings up front so the common
+    invalid cases never pay for a raised ValueError. Non-finite values
+    (inf, nan) are rejected too: they are never valid dimensions.
+    """
+    s = s.strip()
+    if not s or not (s[0].isdigit() or s[0] in '+-.'):
+        return None
     try:
-        rbd = float(entry_roller_base_diameter.get())
+        value = float(s)
     except ValueError:
-        return
+        return None
+    return value if math.isfinite(value) else None
 
-    found_bearing = find_bearing_by_ID(bearings_list, rbd)
-    if found_bearing:
-        roller_base_bearing_thickness_var.set(str(found_bearing['Thickness']))
-        roller_base_bearing_od_var.set(str(found_bearing['OD']))
-        part_number_roller_base_var.set(found_bearing['PartNumber'])
+def _to_int(s):
+    """
+    Converts an entry string to int, returning None on invalid input.
+    Same fast-reject shape as _to_float; keeps the strict integer
+    validation for count fields, so "3.5" is rejected.
+    """
+    s = s.strip()
+    if not s or not (s[0].isdigit() or s[0] in '+-'):
+        return None
+    try:
+        return int(s)
+    except ValueError:
+        return None
 
 def calculate_cycloidal_params():
     """
@@ -75,21 +231,18 @@ def calculate_cycloidal_params():
     Pulls all relevant inputs, computes derived parameters,
     and updates fields accordingly.
     """
-    try:
-        shaft_diam = float(entry_shaft_diameter.get())
-        num_drive_rollers = int(entry_num_drive_rollers.get())
-        drive_roller_diam = float(entry_drive_roller_diameter.get())
-        drive_roller_base_thickness = float(entry_drive_roller_base_thickness.get())
-        roller_base_diam = float(entry_roller_base_diameter.get())
-        ring_pin_diam = float(entry_ring_pin_diameter.get())
-        cycloidal_pin_diam = float(entry_cycloidal_pin_diameter.get())
-        cycloidal_pin_height = float(entry_cycloidal_pin_height.get())
-        tolerance_val = float(entry_tolerance.get())
-        cycloidal_disc_id = float(cycloidal_disc_id_var.get())
-        cycloidal_disc_thickness = float(entry_cycloidal_disc_thickness.get())
-    except ValueError:
+    # Batch-read every input once via the pre-bound getters in ENTRIES;
+    # bail out if any field fails its converter
+    vals = {name: conv(getter()) for name, (getter, conv) in ENTRIES.items()}
+    if any(v is None for v in vals.values()):
         return
 
+    # Bind the values used below to locals
+    drive_roller_diam = vals['drive_roller_diam']
+    ring_pin_diam = vals['ring_pin_diam']
+    cycloidal_pin_diam = vals['cycloidal_pin_diam']
+    tolerance_val = vals['tolerance_val']
+
     # Example: auto-calculate hole diameters
     # For drive rollers: hole_diameter = drive_roller_diam + a bit of clearance
     # Use tolerance_val if you want to reduce the hole by that margin or add clearance
@@ -114,16 +267,20 @@ def calculate_cycloidal_params():
 root = tk.Tk()
 root.title("Cycloidal Drive Calculator")
 
-# Load bearing data from CSV
-csv_filename = "bearing.csv"
-bearings_list = load_bearings(csv_filename)
-
-# StringVar variables for real-time updates
+# Prefer the catalog pre-parsed at build time by build_bearings.py;
+# importing the literals skips CSV I/O and float parsing at startup.
+# Fall back to parsing the CSV if the generated module is absent.
+csv_filename = "bearings.csv"
+try:
+    from bearings_data import BEARINGS as bearings_list, INDEX as bearings_index
+except ImportError:
+    bearings_list, bearings_index = load_bearings(csv_filename)
+
+# StringVar variables for real-time updates; the write traces are hooked
+# up further down, once the widgets the handlers pre-bind exist
 shaft_diameter_var = tk.StringVar()
-shaft_diameter_var.trace_add("write", on_shaft_diameter_change)
 
 roller_base_diameter_var = tk.StringVar()
-roller_base_diameter_var.trace_add("write", on_roller_base_diameter_change)
 
 bearing_thickness_var = tk.StringVar()
 bearing_od_var = tk.StringVar()
@@ -233,6 +390,31 @@ label_cycloidal_disc_thickness.grid(row=8, column=2, sticky="e")
 entry_cycloidal_disc_thickness = tk.Entry(root)
 entry_cycloidal_disc_thickness.grid(row=8, column=3, padx=5, pady=5)
 
+# Inputs read by calculate_cycloidal_params: parameter name ->
+# (pre-bound getter, converter). The getters are bound once here so the
+# calculation reads each widget exactly once per run; counts use _to_int,
+# dimensions use _to_float.
+ENTRIES = {
+    'shaft_diam': (entry_shaft_diameter.get, _to_float),
+    'num_drive_rollers': (entry_num_drive_rollers.get, _to_int),
+    'drive_roller_diam': (entry_drive_roller_diameter.get, _to_float),
+    'drive_roller_base_thickness': (entry_drive_roller_base_thickness.get, _to_float),
+    'roller_base_diam': (entry_roller_base_diameter.get, _to_float),
+    'ring_pin_diam': (entry_ring_pin_diameter.get, _to_float),
+    'cycloidal_pin_diam': (entry_cycloidal_pin_diameter.get, _to_float),
+    'cycloidal_pin_height': (entry_cycloidal_pin_height.get, _to_float),
+    'tolerance_val': (entry_tolerance.get, _to_float),
+    'cycloidal_disc_id': (cycloidal_disc_id_var.get, _to_float),
+    'cycloidal_disc_thickness': (entry_cycloidal_disc_thickness.get, _to_float),
+}
+
+# Build the debounced workers now that the widgets and Tk variables they
+# pre-bind exist, then hook the write traces to the entry variables
+_do_shaft_change = _make_shaft_handler()
+_do_roller_base_change = _make_roller_base_handler()
+shaft_diameter_var.trace_add("write", on_shaft_diameter_change)
+roller_base_diameter_var.trace_add("write", on_roller_base_diameter_change)
+
 # ------------- ROW 9: Calculated Hole Diameters (Results) -------------
 label_hole_drive_roller = tk.Label(root, text="Hole Diameter for Drive Rollers (mm)")
 label_hole_drive_roller.grid(row=9, column=0, sticky="e")
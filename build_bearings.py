@@ -0,0 +1,79 @@
+import csv
+import os
+
+# Build-time helper: parses the bearing CSV once and writes bearings_data.py
+# containing the catalog as Python literals (BEARINGS list + quantized-ID
+# INDEX). CycloidCalculator.py imports that module at startup instead of
+# re-parsing the CSV on every launch. Rerun this script whenever the CSV
+# changes:
+#
+#     python build_bearings.py
+#
+# The parsing here mirrors load_bearings in CycloidCalculator.py, which
+# cannot be imported directly because importing it starts the GUI.
+
+CSV_FILENAME = "bearings.csv"
+OUTPUT_FILENAME = "bearings_data.py"
+
+def _id_key(inner_diameter):
+    """
+    Quantizes an inner diameter to an integer key (1e-6 mm resolution).
+    Must match _id_key in CycloidCalculator.py.
+    """
+    return int(round(inner_diameter * 1e6))
+
+def parse_bearings(csv_filename):
+    """
+    Parses the bearing CSV into a list of dictionaries, same layout as
+    load_bearings in CycloidCalculator.py.
+    """
+    bearings_data = []
+    if not os.path.isfile(csv_filename):
+        return bearings_data
+
+    with open(csv_filename, mode='r', newline='', encoding='utf-8') as csv_file:
+        reader = csv.reader(csv_file)
+        headers = next(reader, None)
+        if headers is None:
+            return bearings_data
+        pn_i = headers.index('Bearing')
+        id_i = headers.index('Inner Diameter (ID)')
+        od_i = headers.index('Outer Diameter (OD)')
+        th_i = headers.index('Thickness')
+        for row in reader:
+            # csv.reader yields [] for blank lines; skip them
+            if not row:
+                continue
+            bearings_data.append({
+                'PartNumber': row[pn_i],
+                'ID': float(row[id_i]),
+                'OD': float(row[od_i]),
+                'Thickness': float(row[th_i])
+            })
+    return bearings_data
+
+def write_bearings_module(bearings_data, output_filename):
+    """
+    Writes the parsed catalog to output_filename as importable literals.
+    """
+    with open(output_filename, mode='w', encoding='utf-8') as out:
+        out.write("# Generated by build_bearings.py from %s -- do not edit by hand.\n"
+                  % CSV_FILENAME)
+        out.write("\nBEARINGS = [\n")
+        for bearing in bearings_data:
+            out.write("    %r,\n" % (bearing,))
+        out.write("]\n")
+        out.write("\nINDEX = {\n")
+        for i, bearing in enumerate(bearings_data):
+            out.write("    %r: BEARINGS[%d],\n" % (_id_key(bearing['ID']), i))
+        out.write("}\n")
+
+if __name__ == "__main__":
+    bearings = parse_bearings(CSV_FILENAME)
+    # Refuse to write an empty module: it would import successfully and
+    # permanently shadow the CSV fallback in CycloidCalculator.py
+    if not bearings:
+        raise SystemExit("%s is missing or has no bearing rows; not writing %s"
+                         % (CSV_FILENAME, OUTPUT_FILENAME))
+    write_bearings_module(bearings, OUTPUT_FILENAME)
+    print("Wrote %d bearings to %s" % (len(bearings), OUTPUT_FILENAME))